@@ -4,14 +4,14 @@ Skoda Connect integration
 
 Read more at https://github.com/lendy007/homeassistant-skodaconnect/
 """
-import re
-import asyncio
+import json
 import logging
 from datetime import datetime, timedelta
-from typing import Union
+from typing import Dict, Union
+import aiohttp
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigEntry, SOURCE_REAUTH, SOURCE_IMPORT
+from homeassistant.config_entries import ConfigEntry, SOURCE_IMPORT
 from homeassistant.const import (
     CONF_NAME,
     CONF_PASSWORD,
@@ -22,7 +22,7 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv, device_registry
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.icon import icon_for_battery_level
@@ -65,11 +65,25 @@ from .const import (
     SERVICE_SET_PHEATER_DURATION,
 )
 
+CHARGE_LIMITS = frozenset(range(0, 101, 10))
+CHARGE_CURRENT_LEVELS = frozenset(
+    ['Maximum', 'maximum', 'Max', 'max', 'Minimum', 'minimum', 'Min', 'min', 'Reduced', 'reduced']
+)
+
+
+def _device_id(value):
+    """Validate a Home Assistant device ID in a single validator call."""
+    value = str(value)
+    if len(value) != 32:
+        raise vol.Invalid("Device ID must be 32 characters")
+    return value
+
+
 SERVICE_SET_SCHEDULE_SCHEMA = vol.Schema(
     {
-        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
-        vol.Required("id"): vol.In([1,2,3]),
-        vol.Required("time"): cv.string,
+        vol.Required("device_id"): _device_id,
+        vol.Required("id"): vol.In(frozenset([1, 2, 3])),
+        vol.Required("time"): cv.time,
         vol.Required("enabled"): cv.boolean,
         vol.Required("recurring"): cv.boolean,
         vol.Optional("date"): cv.string,
@@ -79,32 +93,32 @@ SERVICE_SET_SCHEDULE_SCHEMA = vol.Schema(
         vol.Optional("charging"): cv.boolean,
         vol.Optional("charge_current"): vol.Any(
             vol.Range(min=1, max=254),
-            vol.In(['Maximum', 'maximum', 'Max', 'max', 'Minimum', 'minimum', 'Min', 'min', 'Reduced', 'reduced'])
+            vol.In(CHARGE_CURRENT_LEVELS)
         ),
-        vol.Optional("charge_target"): vol.In([0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]),
+        vol.Optional("charge_target"): vol.In(CHARGE_LIMITS),
         vol.Optional("off_peak_active"): cv.boolean,
-        vol.Optional("off_peak_start"): cv.string,
-        vol.Optional("off_peak_end"): cv.string,
+        vol.Optional("off_peak_start"): cv.time,
+        vol.Optional("off_peak_end"): cv.time,
     }
 )
 SERVICE_SET_MAX_CURRENT_SCHEMA = vol.Schema(
     {
-        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
+        vol.Required("device_id"): _device_id,
         vol.Required("current"): vol.Any(
             vol.Range(min=1, max=255),
-            vol.In(['Maximum', 'maximum', 'Max', 'max', 'Minimum', 'minimum', 'Min', 'min', 'Reduced', 'reduced'])
+            vol.In(CHARGE_CURRENT_LEVELS)
         ),
     }
 )
 SERVICE_SET_CHARGE_LIMIT_SCHEMA = vol.Schema(
     {
-        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
-        vol.Required("limit"): vol.In([0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]),
+        vol.Required("device_id"): _device_id,
+        vol.Required("limit"): vol.In(CHARGE_LIMITS),
     }
 )
 SERVICE_SET_CLIMATER_SCHEMA = vol.Schema(
     {
-        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
+        vol.Required("device_id"): _device_id,
         vol.Required("enabled", default=True): cv.boolean,
         vol.Optional("temp"): vol.All(vol.Coerce(int), vol.Range(min=16, max=30)),
         vol.Optional("battery_power"): cv.boolean,
@@ -114,8 +128,8 @@ SERVICE_SET_CLIMATER_SCHEMA = vol.Schema(
 )
 SERVICE_SET_PHEATER_DURATION_SCHEMA = vol.Schema(
     {
-        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
-        vol.Required("duration"): vol.In([10, 20, 30, 40, 50, 60]),
+        vol.Required("device_id"): _device_id,
+        vol.Required("duration"): vol.In(frozenset([10, 20, 30, 40, 50, 60])),
     }
 )
 
@@ -140,15 +154,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     try:
         if not await coordinator.async_login():
-            await hass.config_entries.flow.async_init(
-                DOMAIN,
-                context={"source": SOURCE_REAUTH},
-                data=entry,
-            )
+            # Release pooled connections before giving up, a retry builds a new coordinator
+            await coordinator._session.close()
+            entry.async_start_reauth(hass)
             return False
     except (SkodaAuthenticationException, SkodaAccountLockedException, SkodaLoginFailedException) as e:
+        await coordinator._session.close()
         raise ConfigEntryAuthFailed(e) from e
     except Exception as e:
+        await coordinator._session.close()
         raise ConfigEntryNotReady(e) from e
 
     entry.async_on_unload(
@@ -157,6 +171,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     await coordinator.async_refresh()
     if not coordinator.last_update_success:
+        # Log out and close the session, a retry builds a new coordinator
+        await coordinator.async_logout()
         raise ConfigEntryNotReady
 
     # Get parent device
@@ -180,10 +196,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         _LOGGER.debug(f"All instruments (data): {conf_instruments}")
     new_instruments = {}
 
-    def is_enabled(attr):
-        """Return true if the user has enabled the resource."""
-        return attr in entry.data.get(CONF_RESOURCES, [attr])
-
     components = set()
 
     # Check if new instruments
@@ -225,19 +237,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             options={**entry.options, **update['options']}
         )
 
-    for instrument in (
-        instrument
-        for instrument in instruments
-        if instrument.component in PLATFORMS and is_enabled(instrument.slug_attr)
-    ):
-        data.instruments.add(instrument)
-        components.add(PLATFORMS[instrument.component])
+    # Resources enabled by the user, None means all resources are enabled
+    resources = entry.data.get(CONF_RESOURCES)
+    if isinstance(resources, list):
+        resources = frozenset(resources)
+    platforms_map = PLATFORMS
 
-    for component in components:
-        coordinator.platforms.append(component)
-        hass.async_create_task(
-            hass.config_entries.async_forward_entry_setup(entry, component)
-        )
+    for instrument in instruments:
+        platform = platforms_map.get(instrument.component)
+        if platform is not None and (resources is None or instrument.slug_attr in resources):
+            data.instruments.add(instrument)
+            components.add(platform)
 
     hass.data[DOMAIN][entry.entry_id] = {
         UPDATE_CALLBACK: update_callback,
@@ -245,6 +255,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         UNDO_UPDATE_LISTENER: entry.add_update_listener(_async_update_listener),
     }
 
+    coordinator.platforms = list(components)
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
+
     # Service functions
     async def get_car(service_call):
         """Get VIN associated with HomeAssistant device ID."""
@@ -253,15 +266,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         dev_reg = device_registry.async_get(hass)
         dev_entry = dev_reg.async_get(dev_id)
 
-        # Get vehicle VIN from device identifiers
-        skoda_identifiers = [
-            identifier
-            for identifier in dev_entry.identifiers
-            if identifier[0] == DOMAIN
-        ]
-        vin_identifier = next(iter(skoda_identifiers))
-        vin = vin_identifier[1]
-
         # Get coordinator handling the device entry
         conf_entry = next(iter(dev_entry.config_entries))
         try:
@@ -269,83 +273,70 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         except:
             raise SkodaConfigException('Could not find associated coordinator for given vehicle')
 
-        # Return with associated Vehicle class object
-        return dev_coordinator.connection.vehicle(vin)
+        # Return cached vehicle if device has been resolved before
+        car = dev_coordinator._car_cache.get(dev_id)
+        if car is not None:
+            return car
+
+        # Get vehicle VIN from device identifiers
+        vin = next(
+            identifier[1]
+            for identifier in dev_entry.identifiers
+            if identifier[0] == DOMAIN
+        )
+
+        # Cache and return with associated Vehicle class object
+        car = dev_coordinator.connection.vehicle(vin)
+        dev_coordinator._car_cache[dev_id] = car
+        return car
 
     async def set_schedule(service_call=None):
         """Set departure schedule."""
         try:
-            # Prepare data
-            id = service_call.data.get("id", 0)
-            temp = None
-
-            # Convert datetime objects to simple strings or check that strings are correctly formatted
-            try:
-                time = service_call.data.get("time").strftime("%H:%M")
-            except:
-                if re.match('^[0-9]{2}:[0-9]{2}$', service_call.data.get('time', '')):
-                    time = service_call.data.get("time", "08:00")
-                else:
-                    raise SkodaInvalidRequestException(f"Invalid time string: {service_call.data.get('time')}")
-            if service_call.data.get("off_peak_start", False):
-                try:
-                    peakstart = service_call.data.get("off_peak_start").strftime("%H:%M")
-                except:
-                    if re.match('^[0-9]{2}:[0-9]{2}$', service_call.data.get("off_peak_start", "")):
-                        time = service_call.data.get("off_peak_start", "00:00")
-                    else:
-                        raise SkodaInvalidRequestException(f"Invalid value for off peak start hours: {service_call.data.get('off_peak_start')}")
-            if service_call.data.get("off_peak_end", False):
-                try:
-                    peakend = service_call.data.get("off_peak_end").strftime("%H:%M")
-                except:
-                    if re.match('^[0-9]{2}:[0-9]{2}$', service_call.data.get("off_peak_end", "")):
-                        time = service_call.data.get("off_peak_end", "00:00")
-                    else:
-                        raise SkodaInvalidRequestException(f"Invalid value for off peak end hours: {service_call.data.get('off_peak_end')}")
+            # Prepare data, schema has already coerced times to datetime.time objects
+            data = service_call.data
+            id = data["id"]
 
             # Convert to parseable data
             schedule = {
-                "id": service_call.data.get("id", 1),
-                "enabled": service_call.data.get("enabled"),
-                "recurring": service_call.data.get("recurring"),
-                "date": service_call.data.get("date"),
-                "time": time,
-                "days": service_call.data.get("days", "nnnnnnn"),
+                "id": id,
+                "enabled": data["enabled"],
+                "recurring": data["recurring"],
+                "date": data.get("date"),
+                "time": data["time"].strftime("%H:%M"),
+                "days": data.get("days", "nnnnnnn"),
             }
             # Set optional values
             # Night rate
-            if service_call.data.get("climatisation", None) is not None:
-                schedule["nightRateActive"] = service_call.data.get("climatisation")
-            if service_call.data.get("off_peak_start", None) is not None:
-                schedule["nightRateTimeStart"] = service_call.data.get("off_peak_start")
-            if service_call.data.get("off_peak_end", None) is not None:
-                schedule["nightRateTimeEnd"] = service_call.data.get("off_peak_end")
+            if data.get("climatisation") is not None:
+                schedule["nightRateActive"] = data["climatisation"]
+            if data.get("off_peak_start") is not None:
+                schedule["nightRateTimeStart"] = data["off_peak_start"].strftime("%H:%M")
+            if data.get("off_peak_end") is not None:
+                schedule["nightRateTimeEnd"] = data["off_peak_end"].strftime("%H:%M")
             # Climatisation and charging options
-            if service_call.data.get("climatisation", None) is not None:
-                schedule["operationClimatisation"] = service_call.data.get("climatisation")
-            if service_call.data.get("charging", None) is not None:
-                schedule["operationCharging"] = service_call.data.get("charging")
-            if service_call.data.get("charge_target", None) is not None:
-                schedule["targetChargeLevel"] = service_call.data.get("charge_target")
-            if service_call.data.get("charge_current", None) is not None:
-                schedule["chargeMaxCurrent"] = service_call.data.get("charge_current")
+            if data.get("climatisation") is not None:
+                schedule["operationClimatisation"] = data["climatisation"]
+            if data.get("charging") is not None:
+                schedule["operationCharging"] = data["charging"]
+            if data.get("charge_target") is not None:
+                schedule["targetChargeLevel"] = data["charge_target"]
+            if data.get("charge_current") is not None:
+                schedule["chargeMaxCurrent"] = data["charge_current"]
             # Global optional options
-            if service_call.data.get("temp", None) is not None:
-                schedule["targetTemp"] = service_call.data.get("temp")
+            if data.get("temp") is not None:
+                schedule["targetTemp"] = data["temp"]
 
             # Find the correct car and execute service call
             car = await get_car(service_call)
-            _LOGGER.info(f'Set departure schedule {id} with data {schedule} for car {car.vin}')
+            _LOGGER.info("Set departure schedule %s with data %s for car %s", id, schedule, car.vin)
             if await car.set_timer_schedule(id, schedule) is True:
-                _LOGGER.debug(f"Service call 'set_schedule' executed without error")
+                _LOGGER.debug("Service call 'set_schedule' executed without error")
                 await coordinator.async_request_refresh()
             else:
-                _LOGGER.warning(f"Failed to execute service call 'set_schedule' with data '{service_call}'")
+                _LOGGER.warning("Failed to execute service call 'set_schedule' with data '%s'", service_call)
         except (SkodaInvalidRequestException) as e:
-            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
-        except Exception as e:
-            raise
+            _LOGGER.warning("Service call 'set_schedule' failed %s", e)
 
     async def set_charge_limit(service_call=None):
         """Set minimum charge limit."""
@@ -353,16 +344,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             car = await get_car(service_call)
 
             # Get charge limit and execute service call
-            limit = service_call.data.get("limit", 50)
+            limit = service_call.data["limit"]
             if await car.set_charge_limit(limit) is True:
-                _LOGGER.debug(f"Service call 'set_charge_limit' executed without error")
+                _LOGGER.debug("Service call 'set_charge_limit' executed without error")
                 await coordinator.async_request_refresh()
             else:
-                _LOGGER.warning(f"Failed to execute service call 'set_charge_limit' with data '{service_call}'")
+                _LOGGER.warning("Failed to execute service call 'set_charge_limit' with data '%s'", service_call)
         except (SkodaInvalidRequestException) as e:
-            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
-        except Exception as e:
-            raise
+            _LOGGER.warning("Service call 'set_charge_limit' failed %s", e)
 
     async def set_current(service_call=None):
         """Set departure schedule."""
@@ -370,28 +359,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             car = await get_car(service_call)
 
             # Get charge current and execute service call
-            current = service_call.data.get('current', None)
+            current = service_call.data["current"]
             if await car.set_charger_current(current) is True:
-                _LOGGER.debug(f"Service call 'set_current' executed without error")
+                _LOGGER.debug("Service call 'set_current' executed without error")
                 await coordinator.async_request_refresh()
             else:
-                _LOGGER.warning(f"Failed to execute service call 'set_current' with data '{service_call}'")
+                _LOGGER.warning("Failed to execute service call 'set_current' with data '%s'", service_call)
         except (SkodaInvalidRequestException) as e:
-            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
-        except Exception as e:
-            raise
+            _LOGGER.warning("Service call 'set_current' failed %s", e)
 
     async def set_pheater_duration(service_call=None):
         """Set duration for parking heater."""
         try:
             car = await get_car(service_call)
-            car.pheater_duration = service_call.data.get("duration", car.pheater_duration)
-            _LOGGER.debug(f"Service call 'set_pheater_duration' executed without error")
+            car.pheater_duration = service_call.data["duration"]
+            _LOGGER.debug("Service call 'set_pheater_duration' executed without error")
             await coordinator.async_request_refresh()
         except (SkodaInvalidRequestException) as e:
-            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
-        except Exception as e:
-            raise
+            _LOGGER.warning("Service call 'set_pheater_duration' failed %s", e)
 
     async def set_climater(service_call=None):
         """Start or stop climatisation with options."""
@@ -408,14 +393,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
                 temp = hvpower = spin = None
             # Execute service call
             if await car.set_climatisation(action, temp, hvpower, spin) is True:
-                _LOGGER.debug(f"Service call 'set_climater' executed without error")
+                _LOGGER.debug("Service call 'set_climater' executed without error")
                 await coordinator.async_request_refresh()
             else:
-                _LOGGER.warning(f"Failed to execute service call 'set_current' with data '{service_call}'")
+                _LOGGER.warning("Failed to execute service call 'set_climater' with data '%s'", service_call)
         except (SkodaInvalidRequestException) as e:
-            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
-        except Exception as e:
-            raise
+            _LOGGER.warning("Service call 'set_climater' failed %s", e)
 
     # Register services
     hass.services.async_register(
@@ -499,17 +482,11 @@ async def async_unload_coordinator(hass: HomeAssistant, entry: ConfigEntry):
     _LOGGER.debug("Unloading coordinator")
     coordinator = hass.data[DOMAIN][entry.entry_id][DATA].coordinator
 
+    coordinator._car_cache.clear()
+
     _LOGGER.debug("Log out from Skoda Connect")
     await coordinator.async_logout()
-    unloaded = all(
-        await asyncio.gather(
-            *[
-                hass.config_entries.async_forward_entry_unload(entry, platform)
-                for platform in PLATFORMS
-                if platform in coordinator.platforms
-            ]
-        )
-    )
+    unloaded = await hass.config_entries.async_unload_platforms(entry, coordinator.platforms)
     if unloaded:
         _LOGGER.debug("Unloading entry")
         del hass.data[DOMAIN][entry.entry_id]
@@ -566,18 +543,18 @@ class SkodaData:
         self.instruments = set()
         self.config = config.get(DOMAIN, config)
         self.name = name
+        # Normalize user configured name once, empty or non-string names fall back to vehicle defaults
+        self._name_str = name if isinstance(name, str) and name else None
         self.coordinator = coordinator
 
     def instrument(self, vin, component, attr):
         """Return corresponding instrument."""
+        if self.coordinator is not None:
+            return self.coordinator._index.get((vin, component, attr))
         return next(
             (
                 instrument
-                for instrument in (
-                    self.coordinator.data
-                    if self.coordinator is not None
-                    else self.instruments
-                )
+                for instrument in self.instruments
                 if instrument.vehicle.vin == vin
                 and instrument.component == component
                 and instrument.attr == attr
@@ -587,23 +564,14 @@ class SkodaData:
 
     def vehicle_name(self, vehicle):
         """Provide a friendly name for a vehicle."""
-        try:
-            # Return name if configured by user
-            if isinstance(self.name, str):
-                if len(self.name) > 0:
-                    return self.name
-        except:
-            pass
+        # Return name if configured by user
+        if self._name_str:
+            return self._name_str
 
         # Default name to nickname if supported, else vin number
-        try:
-            if vehicle.is_nickname_supported:
-                return vehicle.nickname
-            elif vehicle.vin:
-                return vehicle.vin
-        except:
-            _LOGGER.info(f"Name set to blank")
-            return ""
+        if vehicle.is_nickname_supported:
+            return vehicle.nickname
+        return vehicle.vin or ""
 
 
 class SkodaEntity(Entity):
@@ -621,8 +589,12 @@ class SkodaEntity(Entity):
         self.component = component
         self.attribute = attribute
         self.coordinator = data.coordinator
-        self.instrument.callback = update_callbacks
         self.callback = callback
+        self._update_callbacks = update_callbacks
+        self._instrument = None
+        self._instrument_version = None
+        self._vehicle_name_cached = None
+        self.instrument.callback = update_callbacks
 
     async def async_update(self) -> None:
         """Update the entity.
@@ -634,6 +606,10 @@ class SkodaEntity(Entity):
         if not self.enabled:
             return
 
+        # Skip if a refresh is already scheduled, the debouncer would collapse it anyway
+        if self.coordinator._refresh_pending:
+            return
+
         await self.coordinator.async_request_refresh()
 
     async def async_added_to_hass(self):
@@ -651,8 +627,14 @@ class SkodaEntity(Entity):
 
     @property
     def instrument(self):
-        """Return corresponding instrument."""
-        return self.data.instrument(self.vin, self.component, self.attribute)
+        """Return corresponding instrument, re-resolved only when coordinator data has been rebuilt."""
+        version = self.coordinator.data_version if self.coordinator is not None else None
+        if self._instrument is None or self._instrument_version != version:
+            self._instrument = self.data.instrument(self.vin, self.component, self.attribute)
+            self._instrument_version = version
+            if self._instrument is not None:
+                self._instrument.callback = self._update_callbacks
+        return self._instrument
 
     @property
     def icon(self):
@@ -674,7 +656,9 @@ class SkodaEntity(Entity):
 
     @property
     def _vehicle_name(self):
-        return self.data.vehicle_name(self.vehicle)
+        if self._vehicle_name_cached is None:
+            self._vehicle_name_cached = self.data.vehicle_name(self.vehicle)
+        return self._vehicle_name_cached
 
     @property
     def name(self):
@@ -733,6 +717,27 @@ class SkodaEntity(Entity):
         return f"{self.vin}-{self.component}-{self.attribute}"
 
 
+class SkodaInstruments(list):
+    """Instrument list tagged with the fingerprint of the vehicle data it reflects.
+
+    Reused instrument instances compare equal between polls, so equality also
+    checks the fingerprint to let the coordinator notify entities of new data.
+    """
+
+    def __init__(self, instruments, fingerprint):
+        super().__init__(instruments)
+        self.fingerprint = fingerprint
+
+    def __eq__(self, other):
+        if not isinstance(other, SkodaInstruments):
+            return NotImplemented
+        return self.fingerprint == other.fingerprint and super().__eq__(other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+
 class SkodaCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
 
@@ -741,41 +746,106 @@ class SkodaCoordinator(DataUpdateCoordinator):
         self.entry = entry
         self.platforms = []
         self.report_last_updated = None
+        self._car_cache: Dict[str, Vehicle] = {}
+        self._vehicles_by_vin: Dict[str, Vehicle] = {}
+        self._index = {}
+        self.data_version = 0
+        self._refresh_pending = False
+
+        # Options only change through a reload, so resolve dashboard arguments once
+        # Backward compatibility
+        default_convert_conf = get_convert_conf(entry)
+        convert_conf = entry.options.get(
+            CONF_CONVERT,
+            entry.data.get(
+                CONF_CONVERT,
+                default_convert_conf
+            )
+        )
+        self._dashboard_kwargs = dict(
+            mutable=entry.options.get(CONF_MUTABLE),
+            spin=entry.options.get(CONF_SPIN),
+            miles=convert_conf == CONF_IMPERIAL_UNITS,
+            scandinavian_miles=convert_conf == CONF_SCANDINAVIAN_MILES,
+        )
+        # Dedicated session so keep-alive connections to the Skoda API are reused between polls
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=10,
+                limit_per_host=6,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            )
+        )
         self.connection = Connection(
-            session=async_get_clientsession(hass),
+            session=self._session,
             username=self.entry.data[CONF_USERNAME],
             password=self.entry.data[CONF_PASSWORD],
             fulldebug=self.entry.options.get(CONF_DEBUG, self.entry.data.get(CONF_DEBUG, DEFAULT_DEBUG)),
         )
 
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=update_interval)
+        # Coalesce bursts of refresh requests from services and entity callbacks into one poll
+        self._refresh_debouncer = Debouncer(hass, _LOGGER, cooldown=2.0, immediate=False)
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=update_interval,
+            request_refresh_debouncer=self._refresh_debouncer,
+            always_update=False,
+        )
 
     async def _async_update_data(self):
         """Update data via library."""
+        self._refresh_pending = False
         vehicle = await self.update()
 
         if not vehicle:
             raise UpdateFailed("No vehicles found.")
 
-        # Backward compatibility
-        default_convert_conf = get_convert_conf(self.entry)
-
-        convert_conf = self.entry.options.get(
-            CONF_CONVERT,
-            self.entry.data.get(
-                CONF_CONVERT,
-                default_convert_conf
-            )
+        # Skip rebuilding instruments if vehicle payload is unchanged since last poll,
+        # including state instruments read from outside attrs (heater duration, request status)
+        fingerprint = json.dumps(
+            [
+                vehicle.attrs,
+                vehicle.pheater_duration,
+                vehicle.request_in_progress,
+                vehicle.request_results,
+                vehicle.requests_remaining,
+            ],
+            sort_keys=True,
+            default=str,
         )
+        if self.data is not None and fingerprint == self.data.fingerprint:
+            _LOGGER.debug("Vehicle data unchanged, reusing instruments")
+            return self.data
+
+        dashboard = vehicle.dashboard(**self._dashboard_kwargs)
+
+        # Index instruments for constant time lookups from entities, reusing known
+        # instances since instruments read their state from the vehicle object
+        index = {}
+        changed = False
+        for instrument in dashboard.instruments:
+            key = (instrument.vehicle.vin, instrument.component, instrument.attr)
+            existing = self._index.get(key)
+            if existing is not None and existing.vehicle is instrument.vehicle:
+                instrument = existing
+            else:
+                changed = True
+            index[key] = instrument
 
-        dashboard = vehicle.dashboard(
-            mutable=self.entry.options.get(CONF_MUTABLE),
-            spin=self.entry.options.get(CONF_SPIN),
-            miles=convert_conf == CONF_IMPERIAL_UNITS,
-            scandinavian_miles=convert_conf == CONF_SCANDINAVIAN_MILES,
-        )
+        if changed or len(index) != len(self._index):
+            self._index = index
+            self.data_version += 1
+
+        return SkodaInstruments(index.values(), fingerprint)
 
-        return dashboard.instruments
+    async def async_request_refresh(self) -> None:
+        """Request a debounced refresh and mark it as pending."""
+        self._refresh_pending = True
+        await super().async_request_refresh()
 
     async def async_logout(self, event=None):
         """Logout from Skoda Connect"""
@@ -786,6 +856,8 @@ class SkodaCoordinator(DataUpdateCoordinator):
         except Exception as ex:
             _LOGGER.error("Failed to log out and revoke tokens for Skoda Connect. Some tokens might still be valid.")
             return False
+        finally:
+            await self._session.close()
         return True
 
     async def async_login(self):
@@ -803,8 +875,6 @@ class SkodaCoordinator(DataUpdateCoordinator):
         except (SkodaAccountLockedException, SkodaAuthenticationException) as e:
             # Raise auth failed error in config flow
             raise ConfigEntryAuthFailed(e) from e
-        except:
-            raise
 
     async def update(self) -> Union[bool, Vehicle]:
         """Update status from Skoda Connect"""
@@ -812,8 +882,14 @@ class SkodaCoordinator(DataUpdateCoordinator):
         # Update vehicle data
         _LOGGER.debug("Updating data from Skoda Connect")
         try:
-            # Get Vehicle object matching VIN number
-            vehicle = self.connection.vehicle(self.vin)
+            # Get Vehicle object matching VIN number, rebuild lookup if account vehicles changed
+            vehicles = self.connection.vehicles
+            if not self._vehicles_by_vin or len(self._vehicles_by_vin) != len(vehicles):
+                self._vehicles_by_vin = {vehicle.vin.upper(): vehicle for vehicle in vehicles}
+            vehicle = self._vehicles_by_vin.get(self.vin)
+            if not vehicle:
+                _LOGGER.warning("Vehicle %s not found in Skoda Connect account", self.vin)
+                return False
             if await vehicle.update():
                 return vehicle
             else:
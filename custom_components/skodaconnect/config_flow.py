@@ -237,9 +237,9 @@ class SkodaConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_progress_done(next_step_id="vehicle")
 
 
-    async def async_step_reauth(self, entry) -> dict:
+    async def async_step_reauth(self, entry_data) -> dict:
         """Handle initiation of re-authentication with Skoda Connect."""
-        self.entry = entry
+        self.entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
         return await self.async_step_reauth_confirm()
 
     async def async_step_reauth_confirm(self, user_input: dict = None) -> dict: